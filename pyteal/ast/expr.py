@@ -1,4 +1,6 @@
+import sys
 from abc import ABC, abstractmethod
+from traceback import StackSummary, walk_stack
 from typing import Tuple, List, TYPE_CHECKING
 
 from pyteal.types import TealType
@@ -11,13 +13,19 @@ if TYPE_CHECKING:
 class Expr(ABC):
     """Abstract base class for PyTeal expressions."""
 
-    def __init__(self):
-        import traceback
+    # subclasses that declare their own __slots__ carry no per-instance __dict__
+    __slots__ = ("trace",)
 
-        self.trace = traceback.format_stack()[0:-1]
+    def __init__(self):
+        # Walk the raw frames starting at the caller, without reading any source lines. Lines are
+        # only looked up if the trace is actually formatted, e.g. to report a TealCompileError.
+        self.trace = StackSummary.extract(
+            walk_stack(sys._getframe(1)), lookup_lines=False
+        )
+        self.trace.reverse()
 
     def getDefinitionTrace(self) -> List[str]:
-        return self.trace
+        return self.trace.format()
 
     @abstractmethod
     def type_of(self) -> TealType:
@@ -13,6 +13,8 @@ if TYPE_CHECKING:
 class For(Expr):
     """For expression."""
 
+    __slots__ = ("start", "cond", "step", "doBlock")
+
     def __init__(self, start: Expr, cond: Expr, step: Expr) -> None:
         """Create a new For expression.
 
@@ -47,25 +49,26 @@ class For(Expr):
             raise TealCompileError("For expression must have a doBlock", self)
 
         options.enterLoop()
-
-        end = TealSimpleBlock([])
-        start, startEnd = self.start.__teal__(options)
-        condStart, condEnd = self.cond.__teal__(options)
-        doStart, doEnd = self.doBlock.__teal__(options)
-
-        stepStart, stepEnd = self.step.__teal__(options)
-        stepEnd.setNextBlock(condStart)
-        doEnd.setNextBlock(stepStart)
-
-        branchBlock = TealConditionalBlock([])
-        branchBlock.setTrueBlock(doStart)
-        branchBlock.setFalseBlock(end)
-
-        condEnd.setNextBlock(branchBlock)
-
-        startEnd.setNextBlock(condStart)
-
-        breakBlocks, continueBlocks = options.exitLoop()
+        try:
+            end = TealSimpleBlock([])
+            start, startEnd = self.start.__teal__(options)
+            condStart, condEnd = self.cond.__teal__(options)
+            doStart, doEnd = self.doBlock.__teal__(options)
+
+            stepStart, stepEnd = self.step.__teal__(options)
+            stepEnd.setNextBlock(condStart)
+            doEnd.setNextBlock(stepStart)
+
+            branchBlock = TealConditionalBlock([])
+            branchBlock.setTrueBlock(doStart)
+            branchBlock.setFalseBlock(end)
+
+            condEnd.setNextBlock(branchBlock)
+
+            startEnd.setNextBlock(condStart)
+        finally:
+            # always leave the loop, so a compile error does not leave options inside it
+            breakBlocks, continueBlocks = options.exitLoop()
 
         for block in breakBlocks:
             block.setNextBlock(end)
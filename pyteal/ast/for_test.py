@@ -202,6 +202,19 @@ def test_invalid_for():
         expr.__str__()
 
 
+def test_for_compile_error_exits_loop():
+    opts = pt.CompileOptions()
+    i = pt.ScratchVar()
+    expr = pt.For(
+        i.store(pt.Int(0)), i.load() < pt.Int(10), i.store(i.load() + pt.Int(1))
+    ).Do(pt.Return())
+
+    with pytest.raises(pt.TealCompileError):
+        expr.__teal__(opts)
+
+    assert not opts.isInLoop()
+
+
 def test_for_multi():
     i = pt.ScratchVar()
     items = [
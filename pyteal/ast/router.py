@@ -1,4 +1,5 @@
-from dataclasses import dataclass, field, fields, astuple
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from typing import cast, Optional, Callable
 from enum import IntFlag
 
@@ -31,6 +32,16 @@ from pyteal.ast.naryexpr import And, Or
 from pyteal.ast.txn import Txn
 from pyteal.ast.return_ import Approve, Reject
 
+# Expressions shared by every router branch that needs them, so identical subtrees are not rebuilt
+# (and re-traced) per branch. Sharing is only safe because these are Txn field and comparison nodes,
+# which are never modified after construction. Do not add nodes with builder methods that mutate
+# them in place (e.g. If.Then/ElseIf/Else, While.Do, For.Do) to this pool.
+_TXN_ON_COMPLETION = Txn.on_completion()
+_TXN_APP_ID_NE_ZERO = Txn.application_id() != Int(0)
+_TXN_APP_ID_EQ_ZERO = Txn.application_id() == Int(0)
+_TXN_FIRST_APP_ARG = Txn.application_args[0]
+_TXN_NO_APP_ARGS = Txn.application_args.length() == Int(0)
+
 
 class CallConfig(IntFlag):
     """
@@ -51,17 +62,10 @@ class CallConfig(IntFlag):
     ALL = 3
 
     def approval_condition_under_config(self) -> Expr | int:
-        match self:
-            case CallConfig.NEVER:
-                return 0
-            case CallConfig.CALL:
-                return Txn.application_id() != Int(0)
-            case CallConfig.CREATE:
-                return Txn.application_id() == Int(0)
-            case CallConfig.ALL:
-                return 1
-            case _:
-                raise TealInternalError(f"unexpected CallConfig {self}")
+        try:
+            return _APPROVAL_CONDITION_UNDER_CONFIG[self]
+        except KeyError:
+            raise TealInternalError(f"unexpected CallConfig {self}")
 
     def clear_state_condition_under_config(self) -> int:
         match self:
@@ -79,8 +83,55 @@ class CallConfig(IntFlag):
 
 CallConfig.__module__ = "pyteal"
 
+_APPROVAL_CONDITION_UNDER_CONFIG: dict[CallConfig, Expr | int] = {
+    CallConfig.NEVER: 0,
+    CallConfig.CALL: _TXN_APP_ID_NE_ZERO,
+    CallConfig.CREATE: _TXN_APP_ID_EQ_ZERO,
+    CallConfig.ALL: 1,
+}
+
 
-@dataclass(frozen=True)
+def _build_method_approval_conditions() -> dict[tuple[CallConfig, str], Expr | int]:
+    """Build the approval condition for every (CallConfig, OnComplete) pair a method can have.
+
+    There are only a handful of such pairs, so each condition is built once and shared by every
+    MethodConfig, keyed by the CallConfig and the name of the OnComplete value.
+    """
+    conditions: dict[tuple[CallConfig, str], Expr | int] = dict()
+    for config in (
+        CallConfig.NEVER,
+        CallConfig.CALL,
+        CallConfig.CREATE,
+        CallConfig.ALL,
+    ):
+        config_cond = config.approval_condition_under_config()
+        for oc in (
+            OnComplete.NoOp,
+            OnComplete.OptIn,
+            OnComplete.CloseOut,
+            OnComplete.UpdateApplication,
+            OnComplete.DeleteApplication,
+        ):
+            match config_cond:
+                case Expr():
+                    conditions[config, oc.name] = And(
+                        _TXN_ON_COMPLETION == oc, config_cond
+                    )
+                case 1:
+                    conditions[config, oc.name] = _TXN_ON_COMPLETION == oc
+                case 0:
+                    conditions[config, oc.name] = 0
+                case _:
+                    raise TealInternalError(
+                        f"unexpected condition_under_config: {config_cond}"
+                    )
+    return conditions
+
+
+_METHOD_APPROVAL_CONDITIONS = _build_method_approval_conditions()
+
+
+@dataclass(frozen=True, slots=True)
 class MethodConfig:
     """
     MethodConfig keep track of one method's CallConfigs for all OnComplete cases.
@@ -96,8 +147,41 @@ class MethodConfig:
     update_application: CallConfig = field(kw_only=True, default=CallConfig.NEVER)
     delete_application: CallConfig = field(kw_only=True, default=CallConfig.NEVER)
 
+    @classmethod
+    def _from_optionals(
+        cls,
+        no_op: Optional[CallConfig],
+        opt_in: Optional[CallConfig],
+        close_out: Optional[CallConfig],
+        clear_state: Optional[CallConfig],
+        update_application: Optional[CallConfig],
+        delete_application: Optional[CallConfig],
+    ) -> "MethodConfig":
+        """Create a MethodConfig where every unspecified (None) CallConfig is CallConfig.NEVER."""
+        never = CallConfig.NEVER
+        return cls(
+            no_op=never if no_op is None else no_op,
+            opt_in=never if opt_in is None else opt_in,
+            close_out=never if close_out is None else close_out,
+            clear_state=never if clear_state is None else clear_state,
+            update_application=never
+            if update_application is None
+            else update_application,
+            delete_application=never
+            if delete_application is None
+            else delete_application,
+        )
+
     def is_never(self) -> bool:
-        return all(map(lambda cc: cc == CallConfig.NEVER, astuple(self)))
+        return (
+            self.no_op
+            == self.opt_in
+            == self.close_out
+            == self.clear_state
+            == self.update_application
+            == self.delete_application
+            == CallConfig.NEVER
+        )
 
     def approval_cond(self) -> Expr | int:
         config_oc_pairs: list[tuple[CallConfig, EnumInt]] = [
@@ -114,25 +198,19 @@ class MethodConfig:
         else:
             cond_list = []
             for config, oc in config_oc_pairs:
-                config_cond = config.approval_condition_under_config()
-                match config_cond:
-                    case Expr():
-                        cond_list.append(And(Txn.on_completion() == oc, config_cond))
-                    case 1:
-                        cond_list.append(Txn.on_completion() == oc)
-                    case 0:
-                        continue
-                    case _:
-                        raise TealInternalError(
-                            f"unexpected condition_under_config: {config_cond}"
-                        )
+                try:
+                    config_cond = _METHOD_APPROVAL_CONDITIONS[config, oc.name]
+                except KeyError:
+                    raise TealInternalError(f"unexpected CallConfig {config}")
+                if isinstance(config_cond, Expr):
+                    cond_list.append(config_cond)
             return Or(*cond_list)
 
     def clear_state_cond(self) -> Expr | int:
         return self.clear_state.clear_state_condition_under_config()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OnCompleteAction:
     """
     OnComplete Action, registers bare calls to one single OnCompletion case.
@@ -144,7 +222,7 @@ class OnCompleteAction:
     call_config: CallConfig = field(kw_only=True, default=CallConfig.NEVER)
 
     def __post_init__(self):
-        if bool(self.call_config) ^ bool(self.action):
+        if (self.action is None) != (self.call_config == CallConfig.NEVER):
             raise TealInputError(
                 f"action {self.action} and call_config {self.call_config!r} contradicts"
             )
@@ -172,13 +250,13 @@ class OnCompleteAction:
         return OnCompleteAction(action=f, call_config=CallConfig.ALL)
 
     def is_empty(self) -> bool:
-        return not self.action and self.call_config == CallConfig.NEVER
+        return self.action is None and self.call_config == CallConfig.NEVER
 
 
 OnCompleteAction.__module__ = "pyteal"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BareCallActions:
     """
     BareCallActions keep track of bare-call registrations to all OnCompletion cases.
@@ -198,23 +276,26 @@ class BareCallActions:
     )
 
     def is_empty(self) -> bool:
-        for action_field in fields(self):
-            action: OnCompleteAction = getattr(self, action_field.name)
-            if not action.is_empty():
-                return False
-        return True
+        return (
+            self.close_out.is_empty()
+            and self.clear_state.is_empty()
+            and self.delete_application.is_empty()
+            and self.no_op.is_empty()
+            and self.opt_in.is_empty()
+            and self.update_application.is_empty()
+        )
 
     def approval_construction(self) -> Optional[Expr]:
-        oc_action_pair: list[tuple[EnumInt, OnCompleteAction]] = [
+        oc_action_pair: tuple[tuple[EnumInt, OnCompleteAction], ...] = (
             (OnComplete.NoOp, self.no_op),
             (OnComplete.OptIn, self.opt_in),
             (OnComplete.CloseOut, self.close_out),
             (OnComplete.UpdateApplication, self.update_application),
             (OnComplete.DeleteApplication, self.delete_application),
-        ]
+        )
         if all(oca.is_empty() for _, oca in oc_action_pair):
             return None
-        conditions_n_branches: list[CondNode] = list()
+        conditions_n_branches: list[list[Expr]] = list()
         for oc, oca in oc_action_pair:
             if oca.is_empty():
                 continue
@@ -222,29 +303,16 @@ class BareCallActions:
                 False,
                 cast(Expr | SubroutineFnWrapper | ABIReturnSubroutine, oca.action),
             )
-            match oca.call_config:
-                case CallConfig.ALL:
-                    cond_body = wrapped_handler
-                case CallConfig.CALL | CallConfig.CREATE:
-                    cond_body = Seq(
-                        Assert(
-                            cast(
-                                Expr, oca.call_config.approval_condition_under_config()
-                            )
-                        ),
-                        wrapped_handler,
-                    )
-                case _:
-                    raise TealInternalError(
-                        f"Unexpected CallConfig: {oca.call_config!r}"
-                    )
-            conditions_n_branches.append(
-                CondNode(
-                    Txn.on_completion() == oc,
-                    cond_body,
-                )
-            )
-        return Cond(*[[n.condition, n.branch] for n in conditions_n_branches])
+            config_cond = _APPROVAL_CONDITION_UNDER_CONFIG.get(oca.call_config)
+            cond_body: Expr
+            if isinstance(config_cond, Expr):
+                cond_body = Seq(Assert(config_cond), wrapped_handler)
+            elif config_cond == 1:
+                cond_body = wrapped_handler
+            else:
+                raise TealInternalError(f"Unexpected CallConfig: {oca.call_config!r}")
+            conditions_n_branches.append([_TXN_ON_COMPLETION == oc, cond_body])
+        return Cond(*conditions_n_branches)
 
     def clear_state_construction(self) -> Optional[Expr]:
         if self.clear_state.is_empty():
@@ -265,18 +333,20 @@ class BareCallActions:
 BareCallActions.__module__ = "pyteal"
 
 
-@dataclass(frozen=True)
-class CondNode:
-    condition: Expr
-    branch: Expr
-
+@lru_cache(maxsize=4096)
+def _method_call_condition(method_signature: str) -> Expr:
+    """Build the condition that routes an app call to the method with the given signature.
 
-CondNode.__module__ = "pyteal"
+    The same signature is routed in both the approval and clear state programs, so the expression
+    is cached and shared rather than rebuilt.
+    """
+    return _TXN_FIRST_APP_ARG == MethodSignature(method_signature)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTBuilder:
-    conditions_n_branches: list[CondNode] = field(default_factory=list)
+    # each entry is a [condition, branch] pair, ready to be passed to Cond
+    conditions_n_branches: list[list[Expr]] = field(default_factory=list)
 
     @staticmethod
     def wrap_handler(
@@ -304,31 +374,36 @@ class ASTBuilder:
         if not is_method_call:
             match handler:
                 case Expr():
-                    if handler.type_of() != TealType.none:
+                    handler_type = handler.type_of()
+                    if handler_type != TealType.none:
                         raise TealInputError(
-                            f"bare appcall handler should be TealType.none not {handler.type_of()}."
+                            f"bare appcall handler should be TealType.none not {handler_type}."
                         )
                     return handler if handler.has_return() else Seq(handler, Approve())
                 case SubroutineFnWrapper():
-                    if handler.type_of() != TealType.none:
+                    handler_type = handler.type_of()
+                    if handler_type != TealType.none:
                         raise TealInputError(
-                            f"subroutine call should be returning TealType.none not {handler.type_of()}."
+                            f"subroutine call should be returning TealType.none not {handler_type}."
                         )
-                    if handler.subroutine.argument_count() != 0:
+                    arg_count = handler.subroutine.argument_count()
+                    if arg_count != 0:
                         raise TealInputError(
                             f"subroutine call should take 0 arg for bare-app call. "
-                            f"this subroutine takes {handler.subroutine.argument_count()}."
+                            f"this subroutine takes {arg_count}."
                         )
                     return Seq(handler(), Approve())
                 case ABIReturnSubroutine():
-                    if handler.type_of() != "void":
+                    abi_return_type = handler.type_of()
+                    if abi_return_type != "void":
                         raise TealInputError(
-                            f"abi-returning subroutine call should be returning void not {handler.type_of()}."
+                            f"abi-returning subroutine call should be returning void not {abi_return_type}."
                         )
-                    if handler.subroutine.argument_count() != 0:
+                    arg_count = handler.subroutine.argument_count()
+                    if arg_count != 0:
                         raise TealInputError(
                             f"abi-returning subroutine call should take 0 arg for bare-app call. "
-                            f"this abi-returning subroutine takes {handler.subroutine.argument_count()}."
+                            f"this abi-returning subroutine takes {arg_count}."
                         )
                     return Seq(cast(Expr, handler()), Approve())
                 case _:
@@ -340,44 +415,41 @@ class ASTBuilder:
                 raise TealInputError(
                     f"method call should be only registering ABIReturnSubroutine, got {type(handler)}."
                 )
+            subroutine = handler.subroutine
             if not handler.is_abi_routable():
                 raise TealInputError(
                     f"method call ABIReturnSubroutine is not routable "
-                    f"got {handler.subroutine.argument_count()} args with {len(handler.subroutine.abi_args)} ABI args."
+                    f"got {subroutine.argument_count()} args with {len(subroutine.abi_args)} ABI args."
                 )
 
             # All subroutine args types
-            arg_type_specs = cast(
-                list[abi.TypeSpec], handler.subroutine.expected_arg_types
-            )
+            arg_type_specs = cast(list[abi.TypeSpec], subroutine.expected_arg_types)
 
             # All subroutine arg values, initialize here and use below instead of
             # creating new instances on the fly so we dont have to think about splicing
             # back in the transaction types
             arg_vals = [typespec.new_instance() for typespec in arg_type_specs]
 
-            # Only args that appear in app args
-            app_arg_vals: list[abi.BaseType] = [
-                ats for ats in arg_vals if not isinstance(ats, abi.Transaction)
-            ]
-
-            for aav in app_arg_vals:
+            # Partition the args into the ones that appear in app args and the
+            # transaction args (these are omitted from app args)
+            app_arg_vals: list[abi.BaseType] = []
+            txn_arg_vals: list[abi.Transaction] = []
+            for arg in arg_vals:
+                if isinstance(arg, abi.Transaction):
+                    txn_arg_vals.append(arg)
+                    continue
                 # If we're here we know the top level isnt a Transaction but a transaction may
                 # be included in some collection type like a Tuple or Array, raise error
                 # as these are not supported
-                if abi.contains_type_spec(aav.type_spec(), abi.TransactionTypeSpecs):
+                if abi.contains_type_spec(arg.type_spec(), abi.TransactionTypeSpecs):
                     raise TealInputError(
                         "A Transaction type may not be included in Tuples or Arrays"
                     )
+                app_arg_vals.append(arg)
 
             # assign to a var here since we modify app_arg_vals later
             tuplify = len(app_arg_vals) > METHOD_ARG_NUM_CUTOFF
 
-            # only transaction args (these are omitted from app args)
-            txn_arg_vals: list[abi.Transaction] = [
-                ats for ats in arg_vals if isinstance(ats, abi.Transaction)
-            ]
-
             # Tuple-ify any app args after the limit
             if tuplify:
                 last_arg_specs_grouped: list[abi.TypeSpec] = [
@@ -389,8 +461,9 @@ class ASTBuilder:
                 )
 
             # decode app args
+            application_args = Txn.application_args
             decode_instructions: list[Expr] = [
-                app_arg.decode(Txn.application_args[idx + 1])
+                app_arg.decode(application_args[idx + 1])
                 for idx, app_arg in enumerate(app_arg_vals)
             ]
 
@@ -414,10 +487,11 @@ class ASTBuilder:
                 # in the group
 
                 txn_decode_instructions: list[Expr] = []
+                group_index = Txn.group_index()
 
                 for idx, arg_val in enumerate(txn_arg_vals):
                     txn_decode_instructions.append(
-                        arg_val._set_index(Txn.group_index() - Int(txn_arg_len - idx))
+                        arg_val._set_index(group_index - Int(txn_arg_len - idx))
                     )
                     spec = arg_val.type_spec()
                     if type(spec) is not abi.TransactionTypeSpec:
@@ -465,18 +539,18 @@ class ASTBuilder:
     def add_method_to_ast(
         self, method_signature: str, cond: Expr | int, handler: ABIReturnSubroutine
     ) -> None:
-        walk_in_cond = Txn.application_args[0] == MethodSignature(method_signature)
+        walk_in_cond = _method_call_condition(method_signature)
         match cond:
             case Expr():
                 self.conditions_n_branches.append(
-                    CondNode(
+                    [
                         walk_in_cond,
                         Seq(Assert(cond), self.wrap_handler(True, handler)),
-                    )
+                    ]
                 )
             case 1:
                 self.conditions_n_branches.append(
-                    CondNode(walk_in_cond, self.wrap_handler(True, handler))
+                    [walk_in_cond, self.wrap_handler(True, handler)]
                 )
             case 0:
                 return
@@ -486,7 +560,17 @@ class ASTBuilder:
     def program_construction(self) -> Expr:
         if not self.conditions_n_branches:
             return Reject()
-        return Cond(*[[n.condition, n.branch] for n in self.conditions_n_branches])
+        return Cond(*self.conditions_n_branches)
+
+
+@lru_cache(maxsize=4096)
+def _method_selector(method_signature: str) -> bytes:
+    """Compute the 4-byte ABI method selector for a method signature.
+
+    The result is cached, since the underlying SHA-512/256 checksum is the most expensive part of
+    registering a method, and the same signature may be checked many times.
+    """
+    return encoding.checksum(bytes(method_signature, "utf-8"))[:4]
 
 
 class Router:
@@ -532,18 +616,18 @@ class Router:
             bare_call_approval = bare_calls.approval_construction()
             if bare_call_approval:
                 self.approval_ast.conditions_n_branches.append(
-                    CondNode(
-                        Txn.application_args.length() == Int(0),
-                        cast(Expr, bare_call_approval),
-                    )
+                    [
+                        _TXN_NO_APP_ARGS,
+                        bare_call_approval,
+                    ]
                 )
             bare_call_clear = bare_calls.clear_state_construction()
             if bare_call_clear:
                 self.clear_state_ast.conditions_n_branches.append(
-                    CondNode(
-                        Txn.application_args.length() == Int(0),
-                        cast(Expr, bare_call_clear),
-                    )
+                    [
+                        _TXN_NO_APP_ARGS,
+                        bare_call_clear,
+                    ]
                 )
 
     def add_method_handler(
@@ -577,7 +661,7 @@ class Router:
             raise TealInputError(
                 f"registered method {method_signature} is never executed"
             )
-        method_selector = encoding.checksum(bytes(method_signature, "utf-8"))[:4]
+        method_selector = _method_selector(method_signature)
 
         if method_signature in self.method_sig_to_selector:
             raise TealInputError(f"re-registering method {method_signature} detected")
@@ -646,45 +730,48 @@ class Router:
         # - None
         # - CallConfig.Never
         # both cases evaluate to False in if statement.
-        def wrap(_func) -> ABIReturnSubroutine:
-            wrapped_subroutine = ABIReturnSubroutine(_func)
-            call_configs: MethodConfig
-            if (
-                no_op is None
-                and opt_in is None
-                and close_out is None
-                and clear_state is None
-                and update_application is None
-                and delete_application is None
-            ):
-                call_configs = MethodConfig(no_op=CallConfig.CALL)
-            else:
-
-                def none_to_never(x: None | CallConfig):
-                    return CallConfig.NEVER if x is None else x
-
-                _no_op = none_to_never(no_op)
-                _opt_in = none_to_never(opt_in)
-                _close_out = none_to_never(close_out)
-                _clear_state = none_to_never(clear_state)
-                _update_app = none_to_never(update_application)
-                _delete_app = none_to_never(delete_application)
-
-                call_configs = MethodConfig(
-                    no_op=_no_op,
-                    opt_in=_opt_in,
-                    close_out=_close_out,
-                    clear_state=_clear_state,
-                    update_application=_update_app,
-                    delete_application=_delete_app,
-                )
-            return self.add_method_handler(
-                wrapped_subroutine, name, call_configs, description
+        call_configs: MethodConfig
+        if (
+            no_op is None
+            and opt_in is None
+            and close_out is None
+            and clear_state is None
+            and update_application is None
+            and delete_application is None
+        ):
+            call_configs = MethodConfig(no_op=CallConfig.CALL)
+        else:
+            call_configs = MethodConfig._from_optionals(
+                no_op,
+                opt_in,
+                close_out,
+                clear_state,
+                update_application,
+                delete_application,
             )
 
         if not func:
-            return wrap
-        return wrap(func)
+            return partial(
+                self._add_method_from_function,
+                name=name,
+                method_config=call_configs,
+                description=description,
+            )
+        return self._add_method_from_function(
+            func, name=name, method_config=call_configs, description=description
+        )
+
+    def _add_method_from_function(
+        self,
+        func: Callable,
+        *,
+        name: Optional[str],
+        method_config: MethodConfig,
+        description: Optional[str],
+    ) -> ABIReturnSubroutine:
+        return self.add_method_handler(
+            ABIReturnSubroutine(func), name, method_config, description
+        )
 
     def contract_construct(self) -> sdk_abi.Contract:
         """A helper function in constructing a `Contract` object.
@@ -1,7 +1,8 @@
 import pyteal as pt
-from pyteal.ast.router import ASTBuilder
+from pyteal.ast.router import ASTBuilder, _method_selector
 import pytest
 import typing
+import dataclasses
 import algosdk.abi as sdk_abi
 
 
@@ -386,6 +387,18 @@ def test_on_complete_action():
     assert pt.OnCompleteAction.always(pt.Seq()).call_config == pt.CallConfig.ALL
 
 
+def test_router_configs_are_frozen():
+    never = pt.OnCompleteAction.never()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        never.call_config = pt.CallConfig.ALL  # type: ignore[misc]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        pt.MethodConfig().no_op = pt.CallConfig.ALL  # type: ignore[misc]
+
+    assert hash(never) == hash(pt.OnCompleteAction.never())
+    assert hash(pt.MethodConfig()) == hash(pt.MethodConfig())
+    assert hash(pt.BareCallActions()) == hash(pt.BareCallActions())
+
+
 def test_wrap_handler_bare_call():
     BARE_CALL_CASES = [
         dummy_doing_nothing,
@@ -660,6 +673,19 @@ def test_contract_json_obj():
     assert contract == sdk_contract
 
 
+def test_method_selectors():
+    router = pt.Router("selector-test")
+    for subroutine in (add, sub, mul):
+        router.add_method_handler(subroutine)
+
+    for subroutine in (add, sub, mul):
+        method_signature = subroutine.method_signature()
+        selector = sdk_abi.Method.from_signature(method_signature).get_selector()
+        assert _method_selector(method_signature) == selector
+        assert router.method_sig_to_selector[method_signature] == selector
+        assert router.method_selector_to_sig[selector] == method_signature
+
+
 def test_build_program_all_empty():
     router = pt.Router("test")
 
@@ -680,6 +706,28 @@ def test_build_program_all_empty():
     assert contract == expected_contract
 
 
+def test_build_program_reflects_registration_state():
+    router = pt.Router("test")
+
+    approval, clear_state, _ = router.build_program()
+    assert str(approval) == str(pt.Reject())
+    assert str(clear_state) == str(pt.Reject())
+
+    router.add_method_handler(add)
+    approval_after, _, contract = router.build_program()
+    assert str(approval_after) != str(approval)
+    assert contract == sdk_abi.Contract("test", [add.method_spec()])
+
+    replaced_branches = [[pt.Int(1), pt.Reject()]]
+    router.approval_ast.conditions_n_branches = replaced_branches
+    approval_replaced, _, _ = router.build_program()
+    assert str(approval_replaced) == str(pt.Cond(*replaced_branches))
+
+    replaced_branches[0] = [pt.Int(1), pt.Approve()]
+    approval_in_place, _, _ = router.build_program()
+    assert str(approval_in_place) == str(pt.Cond(*replaced_branches))
+
+
 def test_build_program_approval_empty():
     router = pt.Router(
         "test",
@@ -13,6 +13,8 @@ if TYPE_CHECKING:
 class While(Expr):
     """While expression."""
 
+    __slots__ = ("cond", "doBlock")
+
     def __init__(self, cond: Expr) -> None:
         """Create a new While expression.
 
@@ -42,20 +44,21 @@ class While(Expr):
             raise TealCompileError("While expression must have a doBlock", self)
 
         options.enterLoop()
+        try:
+            condStart, condEnd = self.cond.__teal__(options)
+            doStart, doEnd = self.doBlock.__teal__(options)
+            end = TealSimpleBlock([])
 
-        condStart, condEnd = self.cond.__teal__(options)
-        doStart, doEnd = self.doBlock.__teal__(options)
-        end = TealSimpleBlock([])
-
-        doEnd.setNextBlock(condStart)
-
-        branchBlock = TealConditionalBlock([])
-        branchBlock.setTrueBlock(doStart)
-        branchBlock.setFalseBlock(end)
+            doEnd.setNextBlock(condStart)
 
-        condEnd.setNextBlock(branchBlock)
+            branchBlock = TealConditionalBlock([])
+            branchBlock.setTrueBlock(doStart)
+            branchBlock.setFalseBlock(end)
 
-        breakBlocks, continueBlocks = options.exitLoop()
+            condEnd.setNextBlock(branchBlock)
+        finally:
+            # always leave the loop, so a compile error does not leave options inside it
+            breakBlocks, continueBlocks = options.exitLoop()
 
         for block in breakBlocks:
             block.setNextBlock(end)
@@ -152,6 +152,16 @@ def test_while_invalid():
         expr.__str__()
 
 
+def test_while_compile_error_exits_loop():
+    opts = pt.CompileOptions()
+    expr = pt.While(pt.Int(1)).Do(pt.Return())
+
+    with pytest.raises(pt.TealCompileError):
+        expr.__teal__(opts)
+
+    assert not opts.isInLoop()
+
+
 def test_while_multi():
     i = pt.ScratchVar()
     i.store(pt.Int(0))
@@ -1,3 +1,4 @@
+from collections import Counter
 from typing import Tuple, Set, Dict, Optional, cast
 
 from pyteal.ast import ScratchSlot, SubroutineDefinition
@@ -68,21 +69,22 @@ def collectScratchSlots(
 
         subroutineSlots[subroutine] = slots
 
+    # number of subroutines referencing each slot, so shared slots are found in a
+    # single pass instead of intersecting every pair of subroutines
+    referenceCounts: Counter[ScratchSlot] = Counter()
+    for slots in subroutineSlots.values():
+        referenceCounts.update(slots)
+
     # all scratch slots referenced by more than 1 subroutine
-    global_slots: Set[ScratchSlot] = set()
+    global_slots: Set[ScratchSlot] = {
+        slot for slot, count in referenceCounts.items() if count > 1
+    }
 
     # all scratch slots referenced by only 1 subroutine
-    local_slots: Dict[Optional[SubroutineDefinition], Set[ScratchSlot]] = dict()
-
-    for subroutine, slots in subroutineSlots.items():
-        allOtherSlots: Set[ScratchSlot] = set()
-
-        for otherSubroutine, otherSubroutineSlots in subroutineSlots.items():
-            if subroutine is not otherSubroutine:
-                allOtherSlots |= otherSubroutineSlots
-
-        global_slots |= slots & allOtherSlots
-        local_slots[subroutine] = slots - global_slots
+    local_slots: Dict[Optional[SubroutineDefinition], Set[ScratchSlot]] = {
+        subroutine: slots - global_slots
+        for subroutine, slots in subroutineSlots.items()
+    }
 
     return global_slots, local_slots
 
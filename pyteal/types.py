@@ -48,6 +48,16 @@ def types_match(type1: TealType, type2: TealType) -> bool:
     return type1 == type2
 
 
+_BASE32_PATTERN = re.compile(
+    r"^(?:[A-Z2-7]{8})*(?:([A-Z2-7]{2}([=]{6})?)|([A-Z2-7]{4}([=]{4})?)|([A-Z2-7]{5}([=]{3})?)|([A-Z2-7]{7}([=]{1})?))?"
+)
+_BASE64_PATTERN = re.compile(
+    r"^(?:[A-Za-z0-9+/]{4})*(?:[A-Za-z0-9+/]{2}==|[A-Za-z0-9+/]{3}=)?$"
+)
+_BASE16_PATTERN = re.compile(r"[0-9A-Fa-f]*")
+_TMPL_PATTERN = re.compile(r"TMPL_[A-Z0-9_]+")
+
+
 def valid_address(address: str):
     """check if address is a valid address with checksum"""
     if type(address) is not str:
@@ -64,35 +74,23 @@ def valid_address(address: str):
 
 def valid_base32(s: str):
     """check if s is a valid base32 encoding string"""
-    pattern = re.compile(
-        r"^(?:[A-Z2-7]{8})*(?:([A-Z2-7]{2}([=]{6})?)|([A-Z2-7]{4}([=]{4})?)|([A-Z2-7]{5}([=]{3})?)|([A-Z2-7]{7}([=]{1})?))?"
-    )
-
-    if pattern.fullmatch(s) is None:
+    if _BASE32_PATTERN.fullmatch(s) is None:
         raise TealInputError("{} is not a valid RFC 4648 base 32 string".format(s))
 
 
 def valid_base64(s: str):
     """check if s is a valid base64 encoding string"""
-    pattern = re.compile(
-        r"^(?:[A-Za-z0-9+/]{4})*(?:[A-Za-z0-9+/]{2}==|[A-Za-z0-9+/]{3}=)?$"
-    )
-
-    if pattern.fullmatch(s) is None:
+    if _BASE64_PATTERN.fullmatch(s) is None:
         raise TealInputError("{} is not a valid RFC 4648 base 64 string".format(s))
 
 
 def valid_base16(s: str):
     """check if s is a valid hex encoding string"""
-    pattern = re.compile(r"[0-9A-Fa-f]*")
-
-    if pattern.fullmatch(s) is None:
+    if _BASE16_PATTERN.fullmatch(s) is None:
         raise TealInputError("{} is not a valid RFC 4648 base 16 string".format(s))
 
 
 def valid_tmpl(s: str):
     """check if s is valid template name"""
-    pattern = re.compile(r"TMPL_[A-Z0-9_]+")
-
-    if pattern.fullmatch(s) is None:
+    if _TMPL_PATTERN.fullmatch(s) is None:
         raise TealInputError("{} is not a valid template variable".format(s))